@@ -1,6 +1,8 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pyarrow as pa
@@ -279,6 +281,34 @@ class MultiPolygonType(BaseGeometryType):
         return cls(interleaved=True, dims=CoordinateDimension.XY)
 
 
+def construct_geometry_field(
+    extension_name: str,
+    storage_type: pa.DataType,
+    *,
+    field_name: str = "geometry",
+    crs_str: Optional[str] = None,
+) -> pa.Field:
+    """Construct the field of a GeoArrow array, with its extension metadata.
+
+    Args:
+        extension_name: The GeoArrow extension name, e.g. `"geoarrow.point"`.
+        storage_type: The storage type of the array.
+        field_name: The name of the output field.
+        crs_str: The CRS to store in the extension metadata.
+    """
+    extension_metadata: Dict[str, str] = {}
+    if crs_str is not None:
+        extension_metadata["ARROW:extension:metadata"] = json.dumps({"crs": crs_str})
+
+    extension_metadata["ARROW:extension:name"] = extension_name
+    return pa.field(
+        field_name,
+        storage_type,
+        nullable=True,
+        metadata=extension_metadata,
+    )
+
+
 def construct_geometry_array(
     shapely_arr: NDArray[np.object_],
     include_z: Optional[bool] = None,
@@ -300,94 +330,110 @@ def construct_geometry_array(
     else:
         raise ValueError(f"Unexpected coords dimensions: {coords.shape}")
 
-    extension_metadata: Dict[str, str] = {}
-    if crs_str is not None:
-        extension_metadata["ARROW:extension:metadata"] = json.dumps({"crs": crs_str})
-
     if geom_type == GeometryType.POINT:
-        parr = pa.FixedSizeListArray.from_arrays(coords.flatten(), len(dims))
-        extension_metadata["ARROW:extension:name"] = "geoarrow.point"
-        field = pa.field(
-            field_name,
-            parr.type,
-            nullable=True,
-            metadata=extension_metadata,
+        # `coords` is C-contiguous, so `ravel` returns a view and the coordinates are
+        # handed to Arrow without a copy.
+        parr = pa.FixedSizeListArray.from_arrays(coords.ravel(), len(dims))
+        field = construct_geometry_field(
+            "geoarrow.point", parr.type, field_name=field_name, crs_str=crs_str
         )
         return field, parr
 
     elif geom_type == GeometryType.LINESTRING:
         assert len(offsets) == 1, "Expected one offsets array"
         (geom_offsets,) = offsets
-        _parr = pa.FixedSizeListArray.from_arrays(coords.flatten(), len(dims))
+        _parr = pa.FixedSizeListArray.from_arrays(coords.ravel(), len(dims))
         parr = pa.ListArray.from_arrays(pa.array(geom_offsets), _parr)
-        extension_metadata["ARROW:extension:name"] = "geoarrow.linestring"
-        field = pa.field(
-            field_name,
-            parr.type,
-            nullable=True,
-            metadata=extension_metadata,
+        field = construct_geometry_field(
+            "geoarrow.linestring", parr.type, field_name=field_name, crs_str=crs_str
         )
         return field, parr
 
     elif geom_type == GeometryType.POLYGON:
         assert len(offsets) == 2, "Expected two offsets arrays"
         ring_offsets, geom_offsets = offsets
-        _parr = pa.FixedSizeListArray.from_arrays(coords.flatten(), len(dims))
+        _parr = pa.FixedSizeListArray.from_arrays(coords.ravel(), len(dims))
         _parr1 = pa.ListArray.from_arrays(pa.array(ring_offsets), _parr)
         parr = pa.ListArray.from_arrays(pa.array(geom_offsets), _parr1)
-        extension_metadata["ARROW:extension:name"] = "geoarrow.polygon"
-        field = pa.field(
-            field_name,
-            parr.type,
-            nullable=True,
-            metadata=extension_metadata,
+        field = construct_geometry_field(
+            "geoarrow.polygon", parr.type, field_name=field_name, crs_str=crs_str
         )
         return field, parr
 
     elif geom_type == GeometryType.MULTIPOINT:
         assert len(offsets) == 1, "Expected one offsets array"
         (geom_offsets,) = offsets
-        _parr = pa.FixedSizeListArray.from_arrays(coords.flatten(), len(dims))
+        _parr = pa.FixedSizeListArray.from_arrays(coords.ravel(), len(dims))
         parr = pa.ListArray.from_arrays(pa.array(geom_offsets), _parr)
-        extension_metadata["ARROW:extension:name"] = "geoarrow.multipoint"
-        field = pa.field(
-            field_name,
-            parr.type,
-            nullable=True,
-            metadata=extension_metadata,
+        field = construct_geometry_field(
+            "geoarrow.multipoint", parr.type, field_name=field_name, crs_str=crs_str
         )
         return field, parr
 
     elif geom_type == GeometryType.MULTILINESTRING:
         assert len(offsets) == 2, "Expected two offsets arrays"
         ring_offsets, geom_offsets = offsets
-        _parr = pa.FixedSizeListArray.from_arrays(coords.flatten(), len(dims))
+        _parr = pa.FixedSizeListArray.from_arrays(coords.ravel(), len(dims))
         _parr1 = pa.ListArray.from_arrays(pa.array(ring_offsets), _parr)
         parr = pa.ListArray.from_arrays(pa.array(geom_offsets), _parr1)
-        extension_metadata["ARROW:extension:name"] = "geoarrow.multilinestring"
-        field = pa.field(
-            field_name,
+        field = construct_geometry_field(
+            "geoarrow.multilinestring",
             parr.type,
-            nullable=True,
-            metadata=extension_metadata,
+            field_name=field_name,
+            crs_str=crs_str,
         )
         return field, parr
 
     elif geom_type == GeometryType.MULTIPOLYGON:
         assert len(offsets) == 3, "Expected three offsets arrays"
         ring_offsets, polygon_offsets, geom_offsets = offsets
-        _parr = pa.FixedSizeListArray.from_arrays(coords.flatten(), len(dims))
+        _parr = pa.FixedSizeListArray.from_arrays(coords.ravel(), len(dims))
         _parr1 = pa.ListArray.from_arrays(pa.array(ring_offsets), _parr)
         _parr2 = pa.ListArray.from_arrays(pa.array(polygon_offsets), _parr1)
         parr = pa.ListArray.from_arrays(pa.array(geom_offsets), _parr2)
-        extension_metadata["ARROW:extension:name"] = "geoarrow.multipolygon"
-        field = pa.field(
-            field_name,
-            parr.type,
-            nullable=True,
-            metadata=extension_metadata,
+        field = construct_geometry_field(
+            "geoarrow.multipolygon", parr.type, field_name=field_name, crs_str=crs_str
         )
         return field, parr
 
     else:
         raise ValueError(f"Unsupported type for geoarrow: {geom_type}")
+
+
+def construct_geometry_arrays(
+    shapely_arrs: Iterable[NDArray[np.object_]],
+    include_z: Optional[bool] = None,
+    *,
+    field_name: str = "geometry",
+    crs_str: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[pa.Field, List[pa.Array]]:
+    """Construct one GeoArrow array per input shapely array, sharing a single field.
+
+    Raises a `ValueError` if the arrays don't all resolve to the same GeoArrow type.
+
+    Args:
+        shapely_arrs: The shapely arrays to convert.
+        include_z: Whether to include z coordinates.
+        field_name: The name of the output field.
+        crs_str: The CRS to store in the extension metadata.
+        max_workers: The maximum number of threads to use. Defaults to None.
+    """
+    func = partial(
+        construct_geometry_array,
+        include_z=include_z,
+        field_name=field_name,
+        crs_str=crs_str,
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(func, shapely_arrs))
+
+    if not results:
+        raise ValueError("Expected at least one array.")
+
+    field = results[0][0]
+    for arr_field, _ in results[1:]:
+        if not arr_field.equals(field, check_metadata=True):
+            raise ValueError("Expected all arrays to have the same geometry type.")
+
+    return field, [geom_arr for _, geom_arr in results]
@@ -12,14 +12,15 @@ def geopandas_to_geoarrow(
     columns: Optional[List[str]] = None,
     preserve_index: Optional[bool] = None,
 ):
-    df_attr = gdf.drop(columns=[gdf._geometry_column_name])
+    geometry_column_name = gdf._geometry_column_name
+    if columns is None:
+        columns = [name for name in gdf.columns if name != geometry_column_name]
 
-    if columns is not None:
-        df_attr = df_attr[columns]
-
-    table = pa.Table.from_pandas(df_attr, preserve_index=preserve_index)
+    # Select attribute columns in `from_pandas` instead of dropping the geometry column
+    # from the GeoDataFrame, which would copy every attribute column first.
+    table = pa.Table.from_pandas(gdf, columns=columns, preserve_index=preserve_index)
     field, geom_arr = construct_geometry_array(
-        np.array(gdf.geometry),
+        np.asarray(gdf.geometry),
         crs_str=gdf.crs.to_json() if gdf.crs is not None else None,
     )
 
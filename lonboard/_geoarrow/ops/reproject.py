@@ -26,6 +26,27 @@ def no_crs_warning():
     )
 
 
+@lru_cache(maxsize=64)
+def _crs_is_equivalent(crs_str: str, to_crs: Union[str, CRS]) -> bool:
+    """Check whether data in `crs_str` needs no reprojection to reach `to_crs`.
+
+    Constructing and comparing pyproj CRS objects is slow, so this is cached per unique
+    pair of CRS.
+    """
+    existing_crs = CRS(crs_str)
+
+    if existing_crs == to_crs:
+        return True
+
+    # If projecting to OGC_84, also check if existing CRS is EPSG_4326, which when
+    # passing always_xy is equivalent.
+    if to_crs == OGC_84:
+        if existing_crs == EPSG_4326:
+            return True
+
+    return False
+
+
 def reproject_table(
     table: pa.Table,
     *,
@@ -82,16 +103,10 @@ def reproject_column(
         no_crs_warning()
         return field, column
 
-    existing_crs = CRS(crs_str)
-
-    if existing_crs == to_crs:
+    if _crs_is_equivalent(crs_str, to_crs):
         return field, column
 
-    # If projecting to OGC_84, also check if existing CRS is EPSG_4326, which when
-    # passing always_xy is equivalent.
-    if to_crs == OGC_84:
-        if existing_crs == EPSG_4326:
-            return field, column
+    existing_crs = CRS(crs_str)
 
     # NOTE: Not sure the best place to put this warning
     warnings.warn("Input being reprojected to EPSG:4326 CRS")
@@ -158,9 +173,7 @@ def _reproject_coords(arr: pa.FixedSizeListArray, transformer: Transformer):
         raise ValueError(f"Unexpected list size {list_size}")
 
     coord_field = pa.list_(pa.field(dims, pa.float64()), len(dims))
-    return pa.FixedSizeListArray.from_arrays(
-        output_np_arr.flatten("C"), type=coord_field
-    )
+    return pa.FixedSizeListArray.from_arrays(output_np_arr.ravel("C"), type=coord_field)
 
 
 def _reproject_chunk_nest_0(arr: pa.ListArray, transformer: Transformer):
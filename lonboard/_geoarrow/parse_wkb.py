@@ -1,39 +1,67 @@
 """Handle GeoArrow tables with WKB-encoded geometry"""
 
 import json
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
+import numpy as np
 import pyarrow as pa
 import shapely
+from numpy.typing import NDArray
+from shapely import GeometryType
 
 from lonboard._constants import EXTENSION_NAME, OGC_84
 from lonboard._geoarrow.crs import get_field_crs
-from lonboard._geoarrow.extension_types import construct_geometry_array
+from lonboard._geoarrow.extension_types import (
+    construct_geometry_array,
+    construct_geometry_arrays,
+    construct_geometry_field,
+)
 from lonboard._utils import get_geometry_column_index
 
+# Minimum average number of rows per chunk for WKB chunks to be parsed and converted
+# independently. Each chunk handled separately costs roughly 0.1ms of fixed overhead
+# (a thread pool task, a `to_ragged_array` call plus type checks), which is only
+# negligible compared to the conversion itself for chunks of a few thousand rows or
+# more. Smaller chunks are converted as one array and sliced back into the input
+# chunking.
+PER_CHUNK_MIN_ROWS = 5_000
 
-def parse_wkb_table(table: pa.Table) -> pa.Table:
+
+def parse_wkb_table(table: pa.Table, *, max_workers: Optional[int] = None) -> pa.Table:
     """Parse a table with a WKB column into GeoArrow-native geometries.
 
     If no columns are WKB-encoded, returns the input. Note that WKB columns must be
     tagged with an extension name of `geoarrow.wkb` or `ogc.wkb`
+
+    Args:
+        table: The table to parse.
+        max_workers: The maximum number of threads to use. Defaults to None.
     """
     table = parse_geoparquet_table(table)
 
     wkb_names = {EXTENSION_NAME.WKB, EXTENSION_NAME.OGC_WKB}
-    for field_idx in range(len(table.schema)):
-        field = table.field(field_idx)
-        column = table.column(field_idx)
+    wkb_field_indices = [
+        field_idx
+        for field_idx, field in enumerate(table.schema)
+        if field.metadata and field.metadata.get(b"ARROW:extension:name") in wkb_names
+    ]
 
-        if not field.metadata:
-            continue
+    # Most tables have no WKB columns; avoid touching any column in that case.
+    if not wkb_field_indices:
+        return table
 
-        extension_type_name = field.metadata.get(b"ARROW:extension:name")
-        if extension_type_name in wkb_names:
-            new_field, new_column = parse_wkb_column(field, column)
-            table = table.set_column(field_idx, new_field, new_column)
+    # Replace all WKB columns and then construct the new table once, rather than
+    # calling `set_column` (which creates a new table) for each WKB column.
+    fields = list(table.schema)
+    columns = table.columns
+    for field_idx in wkb_field_indices:
+        fields[field_idx], columns[field_idx] = parse_wkb_column(
+            fields[field_idx], columns[field_idx], max_workers=max_workers
+        )
 
-    return table
+    schema = pa.schema(fields, metadata=table.schema.metadata)
+    return pa.Table.from_arrays(columns, schema=schema)
 
 
 def parse_geoparquet_table(table: pa.Table) -> pa.Table:
@@ -74,25 +102,279 @@ def parse_geoparquet_table(table: pa.Table) -> pa.Table:
 
 
 def parse_wkb_column(
-    field: pa.Field, column: pa.ChunkedArray
+    field: pa.Field,
+    column: pa.ChunkedArray,
+    *,
+    max_workers: Optional[int] = None,
 ) -> Tuple[pa.Field, pa.ChunkedArray]:
+    """Parse a WKB-encoded column into GeoArrow-native geometries.
+
+    Args:
+        field: The field describing the column
+        column: A ChunkedArray
+        max_workers: The maximum number of threads to use. Defaults to None.
+    """
     crs_str = get_field_crs(field)
 
-    # We call shapely.from_wkb on the _entire column_ so that we don't get mixed type
-    # arrays in each column.
-    shapely_arr = shapely.from_wkb(column)
+    # The GeoArrow geometry type is inferred from the data, so there must be some
+    if column.num_chunks == 0:
+        raise ValueError("Cannot parse a WKB column with no chunks.")
+
+    # With a single chunk there's no chunking to preserve and no chance of chunks
+    # resolving to different geometry types, so skip the thread pool and slicing.
+    if column.num_chunks == 1:
+        new_field, geom_arr = _parse_wkb_chunk(column.chunk(0), crs_str=crs_str)
+        return new_field, pa.chunked_array([geom_arr], type=new_field.type)
+
+    # Points are by far the most common case where decoding WKB is a bottleneck, and
+    # they have a fixed-size layout that we can read straight from the Arrow buffers.
+    point_chunks = _parse_wkb_points_column(column)
+    if point_chunks is not None:
+        new_field = construct_geometry_field(
+            "geoarrow.point", point_chunks[0].type, crs_str=crs_str
+        )
+        return new_field, pa.chunked_array(point_chunks, type=new_field.type)
+
+    if len(column) / column.num_chunks >= PER_CHUNK_MIN_ROWS:
+        # Shapely releases the GIL while parsing, so chunks are parsed in parallel.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            shapely_arrs = list(executor.map(_from_wkb_chunk, column.chunks))
+
+        # Chunks can only be converted independently if they all resolve to the same
+        # GeoArrow geometry type. That's not the case if, e.g., one chunk has only
+        # Polygons while another has MultiPolygons, or if a chunk is entirely null.
+        # Otherwise we convert the _entire column_ at once so that we don't get mixed
+        # type arrays in each chunk.
+        geometry_types = {_resolve_geometry_type(arr) for arr in shapely_arrs}
+        if len(geometry_types) == 1 and None not in geometry_types:
+            include_z = any(shapely.has_z(arr).any() for arr in shapely_arrs)
+            new_field, geom_arrs = construct_geometry_arrays(
+                shapely_arrs,
+                include_z=include_z,
+                crs_str=crs_str,
+                max_workers=max_workers,
+            )
+            return new_field, pa.chunked_array(geom_arrs, type=new_field.type)
+
+        shapely_arr = np.concatenate(shapely_arrs)
+        del shapely_arrs
+    else:
+        shapely_arr = np.concatenate(
+            [_from_wkb_chunk(chunk) for chunk in column.chunks]
+        )
+
     new_field, geom_arr = construct_geometry_array(
         shapely_arr,
         crs_str=crs_str,
     )
+    # The geometries are no longer needed once converted to GeoArrow
+    del shapely_arr
 
     # Slice full array to maintain chunking
-    chunk_offsets = [0]
-    for chunk in column.chunks:
-        chunk_offsets.append(len(chunk) + chunk_offsets[-1])
+    chunks = _slice_to_chunks(geom_arr, column)
+    return new_field, pa.chunked_array(chunks, type=new_field.type)
+
+
+def _parse_wkb_chunk(
+    chunk: pa.Array, *, crs_str: Optional[str] = None
+) -> Tuple[pa.Field, pa.Array]:
+    """Parse a single chunk of WKB into a GeoArrow-native array"""
+    point_arr = _parse_wkb_points(chunk)
+    if point_arr is not None:
+        new_field = construct_geometry_field(
+            "geoarrow.point", point_arr.type, crs_str=crs_str
+        )
+        return new_field, point_arr
+
+    return construct_geometry_array(_from_wkb_chunk(chunk), crs_str=crs_str)
+
+
+# The WKB layout of a 2D Point: a byte order flag, a uint32 geometry type, then x and y.
+# The byte order flag applies to the rest of each value.
+_WKB_POINT_DTYPE_LE = np.dtype(
+    [("byte_order", "u1"), ("geometry_type", "<u4"), ("x", "<f8"), ("y", "<f8")]
+)
+_WKB_POINT_DTYPE_BE = np.dtype(
+    [("byte_order", "u1"), ("geometry_type", ">u4"), ("x", ">f8"), ("y", ">f8")]
+)
+_WKB_BIG_ENDIAN = 0
+_WKB_LITTLE_ENDIAN = 1
+_WKB_POINT_TYPE = 1
+
+
+def _parse_wkb_points_column(column: pa.ChunkedArray) -> Optional[List[pa.Array]]:
+    """Decode a column of 2D WKB Points directly to GeoArrow Point arrays.
+
+    Returns `None` if any chunk can't be decoded this way, in which case the column
+    should be parsed with shapely.
+    """
+    if column.num_chunks == 0:
+        return None
+
+    # Check the cheap constraints on every chunk before decoding any of them, so that
+    # columns of other geometry types are rejected without reading their values.
+    value_offsets = [_wkb_point_offsets(chunk) for chunk in column.chunks]
+    if any(offsets is None for offsets in value_offsets):
+        return None
+
+    if len(column) / column.num_chunks >= PER_CHUNK_MIN_ROWS:
+        point_chunks = []
+        for chunk, offsets in zip(column.chunks, value_offsets):
+            coords = _decode_wkb_points(chunk, offsets)
+            if coords is None:
+                return None
+
+            point_chunks.append(pa.FixedSizeListArray.from_arrays(coords.ravel(), 2))
+
+        return point_chunks
+
+    # Concatenate the decoded coordinates rather than the WKB itself, which could
+    # overflow the 32-bit offsets of a `binary` array.
+    chunk_coords = []
+    for chunk, offsets in zip(column.chunks, value_offsets):
+        coords = _decode_wkb_points(chunk, offsets)
+        if coords is None:
+            return None
+
+        chunk_coords.append(coords)
+
+    coords = np.concatenate(chunk_coords)
+    del chunk_coords
+    point_arr = pa.FixedSizeListArray.from_arrays(coords.ravel(), 2)
+    return _slice_to_chunks(point_arr, column)
+
+
+def _parse_wkb_points(chunk: pa.Array) -> Optional[pa.FixedSizeListArray]:
+    """Decode a chunk of 2D WKB Points without going through shapely.
+
+    Returns `None` unless every value in the chunk is a non-null 2D Point.
+    """
+    offsets = _wkb_point_offsets(chunk)
+    if offsets is None:
+        return None
+
+    coords = _decode_wkb_points(chunk, offsets)
+    if coords is None:
+        return None
+
+    return pa.FixedSizeListArray.from_arrays(coords.ravel(), 2)
+
+
+def _wkb_point_offsets(chunk: pa.Array) -> Optional[NDArray[np.integer]]:
+    """The value offsets of a chunk whose layout allows it to hold only 2D WKB Points.
+
+    Returns `None` if the chunk is empty, has nulls, or its total size rules out every
+    value being a 2D Point. This doesn't read any values.
+    """
+    if pa.types.is_binary(chunk.type):
+        offsets_dtype = np.int32
+    elif pa.types.is_large_binary(chunk.type):
+        offsets_dtype = np.int64
+    else:
+        return None
+
+    if len(chunk) == 0 or chunk.null_count > 0:
+        return None
+
+    offsets_buf = chunk.buffers()[1]
+    offsets = np.frombuffer(offsets_buf, dtype=offsets_dtype)
+    offsets = offsets[chunk.offset : chunk.offset + len(chunk) + 1]
+
+    # Check the total size first, which rejects other geometry types in constant time
+    if int(offsets[-1]) - int(offsets[0]) != len(chunk) * _WKB_POINT_DTYPE_LE.itemsize:
+        return None
+
+    return offsets
+
+
+def _decode_wkb_points(
+    chunk: pa.Array, offsets: NDArray[np.integer]
+) -> Optional[NDArray[np.float64]]:
+    """Decode the coordinates of a chunk of 2D WKB Points as an `(n, 2)` array.
+
+    Returns `None` unless every value in the chunk is a 2D Point.
+    """
+    if not np.all(np.diff(offsets) == _WKB_POINT_DTYPE_LE.itemsize):
+        return None
+
+    # Read every value as both little and big endian, and select per value with masks
+    # rather than branching on each value's byte order.
+    wkb_points_le = np.frombuffer(
+        chunk.buffers()[2],
+        dtype=_WKB_POINT_DTYPE_LE,
+        count=len(chunk),
+        offset=int(offsets[0]),
+    )
+    wkb_points_be = wkb_points_le.view(_WKB_POINT_DTYPE_BE)
+    byte_order = wkb_points_le["byte_order"]
+    is_little_endian = byte_order == _WKB_LITTLE_ENDIAN
+    if not np.all(is_little_endian | (byte_order == _WKB_BIG_ENDIAN)):
+        return None
+
+    geometry_type = np.where(
+        is_little_endian,
+        wkb_points_le["geometry_type"],
+        wkb_points_be["geometry_type"],
+    )
+    if not np.all(geometry_type == _WKB_POINT_TYPE):
+        return None
+
+    return np.column_stack(
+        (
+            np.where(is_little_endian, wkb_points_le["x"], wkb_points_be["x"]),
+            np.where(is_little_endian, wkb_points_le["y"], wkb_points_be["y"]),
+        )
+    )
+
+
+def _slice_to_chunks(arr: pa.Array, column: pa.ChunkedArray) -> List[pa.Array]:
+    """Slice a full array to match the chunking of `column`"""
+    chunk_lengths = np.fromiter(
+        (len(chunk) for chunk in column.chunks),
+        dtype=np.int64,
+        count=column.num_chunks,
+    )
+    chunk_offsets = np.zeros(column.num_chunks + 1, dtype=np.int64)
+    np.cumsum(chunk_lengths, out=chunk_offsets[1:])
+
+    return [
+        arr.slice(start_slice, chunk_length)
+        for start_slice, chunk_length in zip(
+            chunk_offsets[:-1].tolist(), chunk_lengths.tolist()
+        )
+    ]
+
+
+def _from_wkb_chunk(chunk: pa.Array) -> NDArray[np.object_]:
+    # Convert one chunk at a time to a numpy array of bytes so that shapely iterates
+    # over a plain object array, rather than over a pyarrow array or chunked array.
+    return shapely.from_wkb(chunk.to_numpy(zero_copy_only=False))
+
+
+def _resolve_geometry_type(shapely_arr: NDArray[np.object_]) -> Optional[GeometryType]:
+    """The geometry type that `shapely.to_ragged_array` will create from this array.
+
+    Returns `None` if the array has no non-null geometries or has a combination of
+    geometry types that can't be represented in a single GeoArrow array.
+    """
+    type_ids = shapely.get_type_id(shapely_arr)
+    type_ids = type_ids[type_ids >= 0]
+    if len(type_ids) == 0:
+        return None
+
+    min_type_id = type_ids.min()
+    max_type_id = type_ids.max()
+    if min_type_id == max_type_id:
+        return GeometryType(min_type_id)
 
-    chunks = []
-    for start_slice, end_slice in zip(chunk_offsets[:-1], chunk_offsets[1:]):
-        chunks.append(geom_arr.slice(start_slice, end_slice - start_slice))
+    # Single-part geometries are promoted to the multi-part type when both are present
+    geometry_types = set(np.unique(type_ids).tolist())
+    for single_type, multi_type in [
+        (GeometryType.POINT, GeometryType.MULTIPOINT),
+        (GeometryType.LINESTRING, GeometryType.MULTILINESTRING),
+        (GeometryType.POLYGON, GeometryType.MULTIPOLYGON),
+    ]:
+        if geometry_types == {single_type, multi_type}:
+            return multi_type
 
-    return new_field, pa.chunked_array(chunks)
+    return None
@@ -3,13 +3,19 @@ from tempfile import NamedTemporaryFile
 
 import geodatasets
 import geopandas as gpd
+import pyarrow as pa
 import pyarrow.parquet as pq
+import pytest
+import shapely
 from pyproj import CRS
 
-from lonboard import SolidPolygonLayer
-from lonboard._constants import OGC_84
+from lonboard import ScatterplotLayer, SolidPolygonLayer
+from lonboard._constants import EXTENSION_NAME, OGC_84
+from lonboard._geoarrow import parse_wkb
+from lonboard._geoarrow.extension_types import construct_geometry_array
 from lonboard._geoarrow.geopandas_interop import geopandas_to_geoarrow
 from lonboard._geoarrow.ops.reproject import reproject_table
+from lonboard._geoarrow.parse_wkb import parse_wkb_column, parse_wkb_table
 from lonboard._utils import get_geometry_column_index
 
 
@@ -73,3 +79,190 @@ def test_geoparquet_metadata():
         table = pq.read_table(f)
 
     _layer = SolidPolygonLayer(table=table)
+
+
+# Cover both converting chunks independently and converting the whole column at once
+per_chunk_min_rows = pytest.mark.parametrize(
+    "per_chunk_min_rows", [1, parse_wkb.PER_CHUNK_MIN_ROWS]
+)
+
+
+def wkb_field_and_column(*chunks):
+    field = pa.field(
+        "geometry",
+        pa.binary(),
+        metadata={b"ARROW:extension:name": EXTENSION_NAME.WKB},
+    )
+    column = pa.chunked_array(
+        [pa.array(shapely.to_wkb(chunk), type=pa.binary()) for chunk in chunks],
+        type=pa.binary(),
+    )
+    return field, column
+
+
+def test_parse_wkb_column_preserves_chunking():
+    field, column = wkb_field_and_column(
+        shapely.points([1, 2], [3, 4]), shapely.points([5], [6])
+    )
+    new_field, new_column = parse_wkb_column(field, column)
+
+    assert new_field.metadata[b"ARROW:extension:name"] == EXTENSION_NAME.POINT
+    assert [len(chunk) for chunk in new_column.chunks] == [2, 1]
+    assert new_column.to_pylist() == [[1, 3], [2, 4], [5, 6]]
+
+
+def test_parse_wkb_column_single_chunk():
+    field, column = wkb_field_and_column([shapely.linestrings([[0, 0], [1, 1]])])
+    new_field, new_column = parse_wkb_column(field, column)
+
+    assert new_field.metadata[b"ARROW:extension:name"] == EXTENSION_NAME.LINESTRING
+    assert new_column.num_chunks == 1
+    assert new_column.to_pylist() == [[[0, 0], [1, 1]]]
+
+
+def test_parse_wkb_column_no_chunks():
+    field, column = wkb_field_and_column()
+
+    with pytest.raises(ValueError, match="no chunks"):
+        parse_wkb_column(field, column)
+
+
+@per_chunk_min_rows
+def test_parse_wkb_column_points_match_shapely(monkeypatch, per_chunk_min_rows):
+    """Points decoded directly from WKB match the shapely-based conversion"""
+    monkeypatch.setattr(parse_wkb, "PER_CHUNK_MIN_ROWS", per_chunk_min_rows)
+    points = shapely.points([1, 2, 3, 4], [5, 6, 7, 8])
+    field, column = wkb_field_and_column(points)
+    # Slice to test that array offsets are respected
+    column = pa.chunked_array([column.chunk(0).slice(1, 2), column.chunk(0).slice(3)])
+    new_field, new_column = parse_wkb_column(field, column)
+
+    expected_field, expected_arr = construct_geometry_array(points[1:])
+    assert new_field.equals(expected_field, check_metadata=True)
+    assert new_column.combine_chunks().equals(expected_arr)
+    assert [len(chunk) for chunk in new_column.chunks] == [2, 1]
+
+
+@per_chunk_min_rows
+def test_parse_wkb_column_points_mixed_byte_order(monkeypatch, per_chunk_min_rows):
+    monkeypatch.setattr(parse_wkb, "PER_CHUNK_MIN_ROWS", per_chunk_min_rows)
+    points = shapely.points([1, 2, 3], [4, 5, 6])
+    wkb = shapely.to_wkb(points)
+    wkb[1] = shapely.to_wkb(points[1], byte_order=0)
+    field, _ = wkb_field_and_column(points)
+    arr = pa.array(wkb, type=pa.binary())
+    column = pa.chunked_array([arr.slice(0, 2), arr.slice(2)])
+    _new_field, new_column = parse_wkb_column(field, column)
+
+    assert new_column.to_pylist() == [[1, 4], [2, 5], [3, 6]]
+
+
+def test_parse_wkb_points_column_rejects_small_polygon_chunks():
+    """A column of small non-point chunks is rejected without decoding any chunk"""
+    polygons = shapely.buffer(shapely.points([1, 2, 3], [4, 5, 6]), 1)
+    _field, column = wkb_field_and_column(polygons[:1], polygons[1:2], polygons[2:])
+
+    assert parse_wkb._parse_wkb_points_column(column) is None
+
+
+@per_chunk_min_rows
+def test_parse_wkb_column_polygon_chunks(monkeypatch, per_chunk_min_rows):
+    monkeypatch.setattr(parse_wkb, "PER_CHUNK_MIN_ROWS", per_chunk_min_rows)
+    polygons = shapely.buffer(shapely.points([1, 2, 3], [4, 5, 6]), 1)
+    field, column = wkb_field_and_column(polygons[:2], polygons[2:])
+    new_field, new_column = parse_wkb_column(field, column)
+
+    expected_field, expected_arr = construct_geometry_array(polygons)
+    assert new_field.equals(expected_field, check_metadata=True)
+    assert new_column.combine_chunks().equals(expected_arr)
+    assert [len(chunk) for chunk in new_column.chunks] == [2, 1]
+
+
+@per_chunk_min_rows
+def test_parse_wkb_column_mixed_chunk_types(monkeypatch, per_chunk_min_rows):
+    """Chunks that resolve to different geometry types are parsed as one column"""
+    monkeypatch.setattr(parse_wkb, "PER_CHUNK_MIN_ROWS", per_chunk_min_rows)
+    polygon = shapely.box(0, 0, 1, 1)
+    multipolygon = shapely.multipolygons([shapely.box(2, 2, 3, 3)])
+    field, column = wkb_field_and_column([polygon, polygon], [multipolygon], [None])
+    new_field, new_column = parse_wkb_column(field, column)
+
+    assert new_field.metadata[b"ARROW:extension:name"] == EXTENSION_NAME.MULTIPOLYGON
+    assert [len(chunk) for chunk in new_column.chunks] == [2, 1, 1]
+
+
+@per_chunk_min_rows
+def test_parse_wkb_column_mixed_dimension_chunks(monkeypatch, per_chunk_min_rows):
+    """A 3D chunk makes every chunk 3D"""
+    monkeypatch.setattr(parse_wkb, "PER_CHUNK_MIN_ROWS", per_chunk_min_rows)
+    line_3d = shapely.linestrings([[0, 0, 1], [1, 1, 2]])
+    line_2d = shapely.linestrings([[2, 2], [3, 3]])
+    field, column = wkb_field_and_column([line_3d, line_3d], [line_2d])
+    new_field, new_column = parse_wkb_column(field, column)
+
+    assert new_field.metadata[b"ARROW:extension:name"] == EXTENSION_NAME.LINESTRING
+    assert new_field.type.value_type.list_size == 3
+    assert [len(chunk) for chunk in new_column.chunks] == [2, 1]
+    assert new_column.to_pylist()[0] == [[0, 0, 1], [1, 1, 2]]
+
+
+def test_reproject_equivalent_crs_is_noop():
+    gdf = gpd.GeoDataFrame(geometry=shapely.points([1, 2], [3, 4]), crs="EPSG:4326")
+    table = geopandas_to_geoarrow(gdf)
+    reprojected = reproject_table(table, to_crs=OGC_84)
+    assert reprojected.equals(table, check_metadata=True)
+
+
+def test_geopandas_reprojection_in_geoarrow():
+    """from_geopandas reprojects the GeoArrow table, not the GeoDataFrame"""
+    gdf = gpd.GeoDataFrame(
+        geometry=shapely.points([0, 111_319.49079327357], [0, 0]), crs="EPSG:3857"
+    )
+    layer = ScatterplotLayer.from_geopandas(gdf)
+
+    geom_col_idx = get_geometry_column_index(layer.table.schema)
+    coords = layer.table.column(geom_col_idx).to_pylist()
+    assert coords[0] == [0, 0]
+    assert abs(coords[1][0] - 1) < 1e-9
+    assert gdf.crs == CRS("EPSG:3857"), "input GeoDataFrame should not be modified"
+
+
+def test_parse_wkb_table_single_chunk():
+    polygons = shapely.buffer(shapely.points([1, 2], [3, 4]), 1)
+    field, column = wkb_field_and_column(polygons)
+    table = pa.Table.from_arrays(
+        [pa.array([1, 2]), column],
+        schema=pa.schema([pa.field("id", pa.int64()), field]),
+    )
+    parsed = parse_wkb_table(table)
+
+    assert get_geometry_column_index(parsed.schema) == 1
+    geom_field = parsed.schema.field(1)
+    assert geom_field.metadata[b"ARROW:extension:name"] == EXTENSION_NAME.POLYGON
+    assert parsed.column(1).num_chunks == 1
+    assert parsed.column("id").equals(table.column("id"))
+
+
+def test_parse_wkb_table_multiple_columns():
+    points = shapely.points([1, 2], [3, 4])
+    field, column = wkb_field_and_column(points[:1], points[1:])
+    other_field, other_column = wkb_field_and_column(
+        [shapely.box(0, 0, 1, 1)], [shapely.box(1, 1, 2, 2)]
+    )
+    schema = pa.schema(
+        [field, pa.field("id", pa.int64()), other_field.with_name("other")],
+        metadata={b"key": b"value"},
+    )
+    table = pa.Table.from_arrays(
+        [column, pa.chunked_array([[1], [2]]), other_column], schema=schema
+    )
+    parsed = parse_wkb_table(table)
+
+    assert parsed.schema.metadata == {b"key": b"value"}
+    assert parsed.schema.field(0).metadata[b"ARROW:extension:name"] == (
+        EXTENSION_NAME.POINT
+    )
+    assert parsed.schema.field(2).metadata[b"ARROW:extension:name"] == (
+        EXTENSION_NAME.POLYGON
+    )
+    assert parsed.column("id").equals(table.column("id"))